@@ -1,8 +1,8 @@
 import random
-from rich.console import Console
 from rich.text import Text
 
-console = Console()
+# Share the app-wide console instead of probing the terminal again
+from growcli.utils import console
 
 # =============================================================================
 # LOGO (RAW – NO SPACING ASSUMPTIONS)
@@ -35,6 +35,37 @@ STARTUP_TIPS = [
     "Tip: Press Ctrl+C to exit",
 ]
 
+# =============================================================================
+# PRECOMPUTED FRAME (built once at import – only the style varies per call)
+# =============================================================================
+
+_COMBINED = [f"{g} {c}" for g, c in zip(GROQ, CLI)]
+_CONTENT_WIDTH = max(len(line) for line in _COMBINED + [TAGLINE])
+_BOX_WIDTH = _CONTENT_WIDTH + 8
+
+_TOP = f"╔{'═' * (_BOX_WIDTH - 2)}╗"
+_BOTTOM = f"╚{'═' * (_BOX_WIDTH - 2)}╝"
+_BLANK_ROW = f"║{' ' * (_BOX_WIDTH - 2)}║"
+
+_LOGO_ROWS = [f"║   {line.ljust(_CONTENT_WIDTH)}   ║" for line in _COMBINED]
+
+_TAGLINE_PAD = (_CONTENT_WIDTH - len(TAGLINE)) // 2
+_TAGLINE_ROW = (
+    f"║   {' ' * _TAGLINE_PAD}{TAGLINE}"
+    f"{' ' * (_CONTENT_WIDTH - len(TAGLINE) - _TAGLINE_PAD)}   ║"
+)
+
+_FRAME = [
+    _TOP,
+    _BLANK_ROW,
+    *_LOGO_ROWS,
+    _BLANK_ROW,
+    _TAGLINE_ROW,
+    _BLANK_ROW,
+    _BOTTOM,
+]
+_FRAME_TEXT = "\n".join(_FRAME)
+
 # =============================================================================
 # CORE RENDERER
 # =============================================================================
@@ -42,45 +73,15 @@ STARTUP_TIPS = [
 def show_banner(style="cyan"):
     console.clear()
 
-    combined = [f"{g} {c}" for g, c in zip(GROQ, CLI)]
-    content_width = max(len(line) for line in combined + [TAGLINE])
-    box_width = content_width + 8
-
-    def border(top=True):
-        char = "═"
-        return f"{'╔' if top else '╚'}{char * (box_width - 2)}{'╗' if top else '╝'}"
-
-    console.print()
-    console.print(border(True), style=f"bold {style}")
-
-    console.print(f"║{' ' * (box_width - 2)}║", style=f"bold {style}")
-
-    for g, c in zip(GROQ, CLI):
-        text = Text()
-        text.append(g, style=f"bold {style}")
-        text.append(" ")
-        text.append(c, style="bold white")
-
-        padded = text.plain.ljust(content_width)
-        console.print(
-            f"║   {text}{' ' * (content_width - len(text.plain))}   ║",
-            style=f"bold {style}",
-        )
-
-    console.print(f"║{' ' * (box_width - 2)}║", style=f"bold {style}")
-
-    tagline_pad = (content_width - len(TAGLINE)) // 2
-    console.print(
-        f"║   {' ' * tagline_pad}{TAGLINE}{' ' * (content_width - len(TAGLINE) - tagline_pad)}   ║",
-        style=f"bold {style}",
-    )
-
-    console.print(f"║{' ' * (box_width - 2)}║", style=f"bold {style}")
-    console.print(border(False), style=f"bold {style}")
+    # Assemble the whole banner into one Text so Rich renders and writes once
+    buf = Text("\n")
+    buf.append(_FRAME_TEXT, style=f"bold {style}")
+    buf.append("\n\n")
+    buf.append("GroqCLI Chatbot initialized", style="bold green")
+    buf.append("\n")
+    buf.append("Type /help for available commands", style="dim")
 
-    console.print()
-    console.print("GroqCLI Chatbot initialized", style="bold green")
-    console.print("Type /help for available commands", style="dim")
+    console.print(buf)
 
 
 def show_startup_tip():
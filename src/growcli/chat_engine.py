@@ -5,17 +5,35 @@ Manages conversation history, sends messages, and returns responses
 along with performance metrics. Optimized for fast loading.
 """
 
+import atexit
 import time
 from dataclasses import dataclass, field
-from typing import Optional
-
-from groq import Groq, APIError, APIConnectionError, RateLimitError
+from typing import TYPE_CHECKING, Optional
 
 from growcli.config import Settings
 from growcli.prompts import get_system_prompt
 
+if TYPE_CHECKING:
+    from groq import Groq
+    from rich.console import Console
+
+
+# Separator line for the history display
+_HISTORY_SEP = "─" * 50
+
+
+def _get_console() -> "Console":
+    """
+    Return the app-wide console shared with growcli.utils.
+
+    Imported on first use so loading this module stays cheap, and reused
+    so each chat turn doesn't build and probe a fresh Console.
+    """
+    from growcli.utils import console
+    return console
+
 
-@dataclass
+@dataclass(slots=True)
 class InteractionMetrics:
     """Metrics for a single chat interaction."""
     prompt_tokens: int = 0
@@ -23,13 +41,19 @@ class InteractionMetrics:
     total_tokens: int = 0
     latency_seconds: float = 0.0
     model: str = ""
+    has_code_blocks: bool = False  # Response contains a ``` fence
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """A single message in the conversation."""
     role: str  # "system", "user", or "assistant"
     content: str
+    # API payload, built once so later turns can reuse it
+    api_dict: dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.api_dict = {"role": self.role, "content": self.content}
 
 
 class ChatEngine:
@@ -51,7 +75,7 @@ class ChatEngine:
             settings: Application settings with API key, model, etc.
         """
         self.settings = settings
-        self._client: Optional[Groq] = None  # Lazy loaded
+        self._client: Optional["Groq"] = None  # Lazy loaded
         self.model = settings.groq_model
         self.temperature = settings.temperature
         self.max_tokens = settings.max_tokens
@@ -62,37 +86,55 @@ class ChatEngine:
             role="system",
             content=get_system_prompt(settings.chatbot_name),
         )
+
         self.history: list[Message] = []
 
     @property
-    def client(self) -> Groq:
+    def client(self) -> "Groq":
         """
         Lazy load the Groq client on first use.
         This speeds up initial startup time.
         """
         if self._client is None:
-            from rich.console import Console
-            console = Console()
+            import httpx
+            from groq import Groq
+
+            console = _get_console()
             console.print("  [cyan]🤖 Loading AI model (first time)...[/cyan]", end="")
-            self._client = Groq(api_key=self.settings.groq_api_key)
+
+            # Persistent connection pool so follow-up turns skip the TLS
+            # handshake, multiplexed over HTTP/2.
+            http_client = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60.0),
+                timeout=httpx.Timeout(60.0, connect=10.0),
+            )
+            atexit.register(http_client.close)
+
+            self._client = Groq(
+                api_key=self.settings.groq_api_key,
+                http_client=http_client,
+            )
             console.print(" [bold green]✓[/bold green]")
                 
         return self._client
 
-    def _build_messages(self) -> list[dict[str, str]]:
+    def _build_messages(self, pending: Optional[Message] = None) -> list[dict[str, str]]:
         """
         Build the messages list for the API call.
 
-        Includes the system prompt + conversation history,
-        trimmed to max_history to control token usage.
+        Includes the system prompt + conversation history (plus the pending
+        user message, if given), trimmed to max_history to control token
+        usage. Each message carries its prebuilt payload dict, so earlier
+        turns are not rebuilt on every call.
         """
-        messages = [{"role": self.system_message.role, "content": self.system_message.content}]
-
         # Only keep the last N messages to avoid token overflow
-        recent_history = self.history[-self.max_history :]
-        for msg in recent_history:
-            messages.append({"role": msg.role, "content": msg.content})
+        window = self.max_history - (pending is not None)
+        recent = self.history[-window:] if window > 0 else []
 
+        messages = [self.system_message.api_dict, *(msg.api_dict for msg in recent)]
+        if pending is not None:
+            messages.append(pending.api_dict)
         return messages
 
     def send_message(self, user_input: str) -> tuple[str, InteractionMetrics]:
@@ -108,51 +150,80 @@ class ChatEngine:
         Raises:
             Various Groq exceptions on API failure (handled gracefully).
         """
-        # Add user message to history
-        self.history.append(Message(role="user", content=user_input))
+        from groq import APIError, APIConnectionError, RateLimitError
+
+        # The user message joins the history only once the call succeeds
+        user_message = Message(role="user", content=user_input)
 
         # Build the full message list
-        messages = self._build_messages()
+        messages = self._build_messages(user_message)
 
         # Time the API call with simple spinner
         start_time = time.perf_counter()
+        parts: list[str] = []
+        usage = None
+        has_code_blocks = False
+        tail = ""  # Last two chars seen, for fences split across chunks
 
         try:
-            # Simple spinner for API call
-            from rich.console import Console
-            console = Console()
+            from rich.live import Live
+            from rich.text import Text
+
+            # Simple spinner until the stream opens
+            console = _get_console()
             console.print("\n  [cyan]🤔 Thinking...[/cyan]", end="")
-            
-            response = self.client.chat.completions.create(
+
+            stream = self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 temperature=self.temperature,
                 max_tokens=self.max_tokens,
-                stream=False,
+                stream=True,
             )
-            
+
             console.print(" [bold green]✓[/bold green]")
-                
+
+            # Show tokens as they arrive; the live preview is transient so
+            # the caller's formatted render replaces it once complete.
+            preview = Text()
+            with Live(preview, console=console, transient=True):
+                for chunk in stream:
+                    if chunk.choices:
+                        delta = chunk.choices[0].delta.content
+                        if delta:
+                            parts.append(delta)
+                            preview.append(delta)
+
+                            # Spot code fences while streaming so callers
+                            # don't have to rescan the full response
+                            if not has_code_blocks:
+                                window = tail + delta
+                                has_code_blocks = "```" in window
+                                tail = window[-2:]
+
+                    # Groq reports usage on the final chunk
+                    x_groq = chunk.x_groq
+                    if x_groq is not None and x_groq.usage is not None:
+                        usage = x_groq.usage
+                    elif chunk.usage is not None:
+                        usage = chunk.usage
+
         except APIConnectionError:
-            self.history.pop()  # Remove the failed user message
             return (
                 "❌ Cannot connect to GroqCloud. Check your internet connection.",
                 InteractionMetrics(),
             )
         except RateLimitError:
-            self.history.pop()
             return (
                 "⏳ Rate limit reached. Please wait a moment and try again.",
                 InteractionMetrics(),
             )
         except APIError as e:
-            self.history.pop()
             return (
                 f"❌ API Error: {e.message}",
                 InteractionMetrics(),
             )
         except Exception as e:
-            self.history.pop()
             return (
                 f"❌ Unexpected error: {str(e)}",
                 InteractionMetrics(),
@@ -161,18 +232,19 @@ class ChatEngine:
         end_time = time.perf_counter()
         latency = end_time - start_time
 
-        # Extract response
-        assistant_message = response.choices[0].message.content
+        # Assemble the streamed response
+        assistant_message = "".join(parts)
+        self.history.append(user_message)
         self.history.append(Message(role="assistant", content=assistant_message))
 
         # Build metrics
-        usage = response.usage
         metrics = InteractionMetrics(
             prompt_tokens=usage.prompt_tokens if usage else 0,
             completion_tokens=usage.completion_tokens if usage else 0,
             total_tokens=usage.total_tokens if usage else 0,
             latency_seconds=latency,
             model=self.model,
+            has_code_blocks=has_code_blocks,
         )
 
         return assistant_message, metrics
@@ -186,14 +258,17 @@ class ChatEngine:
         if not self.history:
             return "📭 No conversation history yet."
 
-        lines = ["\n📜 Conversation History:\n" + "─" * 50]
-        for i, msg in enumerate(self.history, 1):
-            role_emoji = "👤 You" if msg.role == "user" else "🤖 Bot"
-            # Truncate long messages for display
-            content = msg.content[:150] + "..." if len(msg.content) > 150 else msg.content
-            lines.append(f"  {i}. [{role_emoji}]: {content}")
-        lines.append("─" * 50)
-        return "\n".join(lines)
+        return "\n".join([
+            "\n📜 Conversation History:",
+            _HISTORY_SEP,
+            # One line per message; long messages are truncated for display
+            *(
+                f"  {i}. [{'👤 You' if msg.role == 'user' else '🤖 Bot'}]: "
+                f"{msg.content if len(msg.content) <= 150 else msg.content[:150] + '...'}"
+                for i, msg in enumerate(self.history, 1)
+            ),
+            _HISTORY_SEP,
+        ])
 
     def get_model_info(self) -> str:
         """Get current model configuration display."""
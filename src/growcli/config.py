@@ -1,13 +1,20 @@
 import os
 import sys
+from functools import lru_cache
 from dataclasses import dataclass, field
 from pathlib import Path
 from dotenv import load_dotenv
 
 
 def _find_dotenv() -> Path | None:
-    """Walk up directories to find .env file."""
-    current = Path.cwd()
+    """Find the nearest .env file for the current working directory."""
+    return _find_dotenv_from(Path.cwd())
+
+
+@lru_cache(maxsize=1)
+def _find_dotenv_from(start: Path) -> Path | None:
+    """Walk up directories from start to find .env file (cached per start dir)."""
+    current = start
     while current != current.parent:
         env_path = current / ".env"
         if env_path.exists():
@@ -16,7 +23,7 @@ def _find_dotenv() -> Path | None:
     return None
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """Application settings loaded from environment variables."""
 
@@ -41,6 +48,8 @@ class Settings:
             errors.append(f"CHATBOT_TEMPERATURE must be 0-2, got {self.temperature}")
         if self.max_tokens < 1:
             errors.append(f"CHATBOT_MAX_TOKENS must be positive, got {self.max_tokens}")
+        if self.max_history < 1:
+            errors.append(f"CHATBOT_MAX_HISTORY must be positive, got {self.max_history}")
         return errors
 
 
@@ -59,13 +68,14 @@ def load_settings() -> Settings:
     if dotenv_path:
         load_dotenv(dotenv_path)
 
+    env = os.environ
     settings = Settings(
-        groq_api_key=os.getenv("GROQ_API_KEY", ""),
-        groq_model=os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile"),
-        chatbot_name=os.getenv("CHATBOT_NAME", "Atlas"),
-        max_history=int(os.getenv("CHATBOT_MAX_HISTORY", "20")),
-        temperature=float(os.getenv("CHATBOT_TEMPERATURE", "0.7")),
-        max_tokens=int(os.getenv("CHATBOT_MAX_TOKENS", "1024")),
+        groq_api_key=env.get("GROQ_API_KEY", ""),
+        groq_model=env.get("GROQ_MODEL", "llama-3.3-70b-versatile"),
+        chatbot_name=env.get("CHATBOT_NAME", "Atlas"),
+        max_history=int(env.get("CHATBOT_MAX_HISTORY", "20")),
+        temperature=float(env.get("CHATBOT_TEMPERATURE", "0.7")),
+        max_tokens=int(env.get("CHATBOT_MAX_TOKENS", "1024")),
     )
 
     # Validate
@@ -10,28 +10,64 @@ Features:
 
 import json
 import os
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional
 from dataclasses import dataclass, asdict
+from contextlib import nullcontext
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+# orjson is optional; fall back to the stdlib json module without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 
+# Only show a spinner for I/O on conversations larger than this (bytes/chars)
+PROGRESS_THRESHOLD = 1_000_000
+
+# Export templates (filled with str.format from metadata / message fields)
+_MD_META_TMPL = (
+    "## Metadata\n\n"
+    "- **Model**: {model}\n"
+    "- **Temperature**: {temperature}\n"
+    "- **Start Time**: {start_time}\n"
+    "- **Total Messages**: {total_messages}\n"
+    "- **Total Tokens**: {total_tokens}\n\n"
+)
+_MD_MSG_TMPL = "### {emoji} {name}\n\n{content}\n\n"
+_MD_STATS_TMPL = "*Tokens: {tokens} | Latency: {latency:.2f}s*\n\n"
+_MD_RULE = "---\n\n"
+
+_TXT_META_TMPL = (
+    "Metadata:\n"
+    "  Model: {model}\n"
+    "  Temperature: {temperature}\n"
+    "  Start Time: {start_time}\n"
+    "  Total Messages: {total_messages}\n"
+    "  Total Tokens: {total_tokens}\n\n"
+)
+_TXT_MSG_TMPL = "{name}:\n{content}\n"
+_TXT_STATS_TMPL = "(Tokens: {tokens} | Latency: {latency:.2f}s)\n"
+_TXT_RULE = "-" * 60 + "\n\n"
 
-@dataclass
+
+@dataclass(slots=True)
 class ConversationMessage:
     """Single message in a conversation."""
     role: str  # "user" or "assistant"
     content: str
-    timestamp: str
+    timestamp: float  # Unix epoch seconds
     tokens: int = 0
     latency: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationMetadata:
     """Metadata for a conversation."""
     session_id: str
@@ -63,15 +99,46 @@ class ConversationManager:
             save_dir: Directory to save conversations
         """
         self.save_dir = Path(save_dir)
-        self.save_dir.mkdir(exist_ok=True)
+        self._dir_ready = False  # Directory is created on first save
         
         self.current_conversation: List[ConversationMessage] = []
         self.metadata: Optional[ConversationMetadata] = None
-        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.session_id = time.strftime("%Y%m%d_%H%M%S")
+        
+        # Saved-conversation paths, newest first; scanned on first listing
+        self._index: Optional[List[str]] = None
+    
+    def _ensure_save_dir(self) -> None:
+        """Create the save directory before the first write."""
+        if not self._dir_ready:
+            self.save_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+    
+    def _content_size(self) -> int:
+        """Total characters of message content in the current conversation."""
+        return sum(len(msg.content) for msg in self.current_conversation)
+    
+    def _progress(self, label: str, size: int):
+        """
+        Spinner context for large saves/loads.
+        
+        Small conversations finish in milliseconds, so a no-op context is
+        returned instead of paying for the Progress refresh thread.
+        """
+        if size <= PROGRESS_THRESHOLD:
+            return nullcontext()
+        
+        progress = Progress(
+            SpinnerColumn(),
+            TextColumn(label),
+            transient=True,
+        )
+        progress.add_task(label, total=None)
+        return progress
     
     def start_session(self, model: str, temperature: float):
         """Start a new conversation session."""
-        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.session_id = time.strftime("%Y%m%d_%H%M%S")
         self.metadata = ConversationMetadata(
             session_id=self.session_id,
             model=model,
@@ -91,7 +158,7 @@ class ConversationManager:
         message = ConversationMessage(
             role=role,
             content=content,
-            timestamp=datetime.now().isoformat(),
+            timestamp=time.time(),
             tokens=tokens,
             latency=latency,
         )
@@ -115,21 +182,27 @@ class ConversationManager:
             filename = f"conversation_{self.session_id}.json"
         
         filepath = self.save_dir / filename
+        self._ensure_save_dir()
         
         data = {
             "metadata": asdict(self.metadata) if self.metadata else {},
             "messages": [asdict(msg) for msg in self.current_conversation]
         }
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold green]Saving conversation..."),
-            transient=True,
-        ) as progress:
-            progress.add_task("Saving", total=None)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+        with self._progress("[bold green]Saving conversation...", self._content_size()):
+            if orjson is not None:
+                filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                filepath.write_text(
+                    json.dumps(data, indent=2, ensure_ascii=False),
+                    encoding='utf-8',
+                )
+        
+        if self._index is not None and filepath.match("conversation_*.json"):
+            path = str(filepath)
+            if path not in self._index:
+                self._index.append(path)
+                self._index.sort(reverse=True)
         
         return str(filepath)
     
@@ -147,41 +220,36 @@ class ConversationManager:
             filename = f"conversation_{self.session_id}.md"
         
         filepath = self.save_dir / filename
+        self._ensure_save_dir()
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold green]Exporting to Markdown..."),
-            transient=True,
-        ) as progress:
-            progress.add_task("Exporting", total=None)
+        with self._progress("[bold green]Exporting to Markdown...", self._content_size()):
+            # Build the whole file in memory and write it once
+            parts: list[str] = []
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                # Write header
-                f.write(f"# Conversation - {self.session_id}\n\n")
-                
-                if self.metadata:
-                    f.write("## Metadata\n\n")
-                    f.write(f"- **Model**: {self.metadata.model}\n")
-                    f.write(f"- **Temperature**: {self.metadata.temperature}\n")
-                    f.write(f"- **Start Time**: {self.metadata.start_time}\n")
-                    f.write(f"- **Total Messages**: {self.metadata.total_messages}\n")
-                    f.write(f"- **Total Tokens**: {self.metadata.total_tokens}\n\n")
+            # Header
+            parts.append(f"# Conversation - {self.session_id}\n\n")
+            
+            if self.metadata:
+                parts.append(_MD_META_TMPL.format_map(asdict(self.metadata)))
+            
+            parts.append(_MD_RULE)
+            parts.append("## Conversation\n\n")
+            
+            # Messages
+            for msg in self.current_conversation:
+                is_user = msg.role == "user"
+                parts.append(_MD_MSG_TMPL.format(
+                    emoji="👤" if is_user else "🤖",
+                    name="You" if is_user else "Assistant",
+                    content=msg.content,
+                ))
                 
-                f.write("---\n\n")
-                f.write("## Conversation\n\n")
+                if msg.tokens > 0:
+                    parts.append(_MD_STATS_TMPL.format(tokens=msg.tokens, latency=msg.latency))
                 
-                # Write messages
-                for msg in self.current_conversation:
-                    role_emoji = "👤" if msg.role == "user" else "🤖"
-                    role_name = "You" if msg.role == "user" else "Assistant"
-                    
-                    f.write(f"### {role_emoji} {role_name}\n\n")
-                    f.write(f"{msg.content}\n\n")
-                    
-                    if msg.tokens > 0:
-                        f.write(f"*Tokens: {msg.tokens} | Latency: {msg.latency:.2f}s*\n\n")
-                    
-                    f.write("---\n\n")
+                parts.append(_MD_RULE)
+            
+            filepath.write_text("".join(parts), encoding='utf-8')
         
         return str(filepath)
     
@@ -199,40 +267,34 @@ class ConversationManager:
             filename = f"conversation_{self.session_id}.txt"
         
         filepath = self.save_dir / filename
+        self._ensure_save_dir()
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold green]Exporting to text..."),
-            transient=True,
-        ) as progress:
-            progress.add_task("Exporting", total=None)
+        with self._progress("[bold green]Exporting to text...", self._content_size()):
+            # Build the whole file in memory and write it once
+            parts: list[str] = []
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                # Write header
-                f.write(f"Conversation - {self.session_id}\n")
-                f.write("=" * 60 + "\n\n")
-                
-                if self.metadata:
-                    f.write("Metadata:\n")
-                    f.write(f"  Model: {self.metadata.model}\n")
-                    f.write(f"  Temperature: {self.metadata.temperature}\n")
-                    f.write(f"  Start Time: {self.metadata.start_time}\n")
-                    f.write(f"  Total Messages: {self.metadata.total_messages}\n")
-                    f.write(f"  Total Tokens: {self.metadata.total_tokens}\n\n")
+            # Header
+            parts.append(f"Conversation - {self.session_id}\n{'=' * 60}\n\n")
+            
+            if self.metadata:
+                parts.append(_TXT_META_TMPL.format_map(asdict(self.metadata)))
+            
+            parts.append(_TXT_RULE)
+            
+            # Messages
+            for msg in self.current_conversation:
+                parts.append(_TXT_MSG_TMPL.format(
+                    name="You" if msg.role == "user" else "Assistant",
+                    content=msg.content,
+                ))
                 
-                f.write("-" * 60 + "\n\n")
+                if msg.tokens > 0:
+                    parts.append(_TXT_STATS_TMPL.format(tokens=msg.tokens, latency=msg.latency))
                 
-                # Write messages
-                for msg in self.current_conversation:
-                    role_name = "You" if msg.role == "user" else "Assistant"
-                    
-                    f.write(f"{role_name}:\n")
-                    f.write(f"{msg.content}\n")
-                    
-                    if msg.tokens > 0:
-                        f.write(f"(Tokens: {msg.tokens} | Latency: {msg.latency:.2f}s)\n")
-                    
-                    f.write("\n" + "-" * 60 + "\n\n")
+                parts.append("\n")
+                parts.append(_TXT_RULE)
+            
+            filepath.write_text("".join(parts), encoding='utf-8')
         
         return str(filepath)
     
@@ -247,24 +309,23 @@ class ConversationManager:
             True if loaded successfully
         """
         try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[bold blue]Loading conversation..."),
-                transient=True,
-            ) as progress:
-                progress.add_task("Loading", total=None)
-                
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+            with self._progress("[bold blue]Loading conversation...", os.path.getsize(filepath)):
+                if orjson is not None:
+                    data = orjson.loads(Path(filepath).read_bytes())
+                else:
+                    with open(filepath, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
                 
                 # Load metadata
                 if 'metadata' in data:
                     self.metadata = ConversationMetadata(**data['metadata'])
                 
-                # Load messages
-                self.current_conversation = [
-                    ConversationMessage(**msg) for msg in data['messages']
-                ]
+                # Load messages (older saves stored ISO-format timestamps)
+                self.current_conversation = []
+                for msg in data['messages']:
+                    if isinstance(msg.get('timestamp'), str):
+                        msg['timestamp'] = datetime.fromisoformat(msg['timestamp']).timestamp()
+                    self.current_conversation.append(ConversationMessage(**msg))
             
             console.print(f"[green]✓[/green] Loaded {len(self.current_conversation)} messages")
             return True
@@ -273,12 +334,23 @@ class ConversationManager:
             console.print(f"[red]✗[/red] Error loading conversation: {e}")
             return False
     
+    def refresh_index(self) -> None:
+        """Rescan the save directory for saved conversations."""
+        self._index = sorted(
+            (str(file) for file in self.save_dir.glob("conversation_*.json")),
+            reverse=True,
+        )
+    
     def list_conversations(self) -> List[str]:
-        """List all saved conversations."""
-        conversations = []
-        for file in self.save_dir.glob("conversation_*.json"):
-            conversations.append(str(file))
-        return sorted(conversations, reverse=True)
+        """
+        List all saved conversations, newest first.
+        
+        The directory is scanned once; later saves update the in-memory
+        index. Call refresh_index() to pick up files written elsewhere.
+        """
+        if self._index is None:
+            self.refresh_index()
+        return list(self._index)
     
     def auto_save(self):
         """Auto-save current conversation."""
@@ -291,9 +363,14 @@ class ConversationManager:
         if not self.current_conversation:
             return "No messages in current conversation"
         
-        user_msgs = sum(1 for msg in self.current_conversation if msg.role == "user")
-        assistant_msgs = sum(1 for msg in self.current_conversation if msg.role == "assistant")
-        total_tokens = sum(msg.tokens for msg in self.current_conversation)
+        # Single pass over the conversation for all three totals
+        user_msgs = assistant_msgs = total_tokens = 0
+        for msg in self.current_conversation:
+            total_tokens += msg.tokens
+            if msg.role == "user":
+                user_msgs += 1
+            elif msg.role == "assistant":
+                assistant_msgs += 1
         
         return (
             f"Messages: {len(self.current_conversation)} "
@@ -4,13 +4,40 @@ Cost tracking for GroqCLI-Chatbot.
 Monitors token usage and calculates costs.
 """
 
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, asdict
 from pathlib import Path
 import json
+import time
 
+# orjson is optional; fall back to the stdlib json module without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+# Cap on stored sessions, bounding the history file's size and parse time
+MAX_HISTORY_ENTRIES = 1000
+
+# The append-only history file is rotated down to MAX_HISTORY_ENTRIES once
+# it grows past this size (roughly twice the cap at ~128 bytes per line)
+MAX_HISTORY_BYTES = MAX_HISTORY_ENTRIES * 256
+
+
+def _dumps(obj: dict) -> str:
+    """Serialize one history record as a single JSON line."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _loads(line: str) -> dict:
+    """Parse one JSON line."""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+@dataclass(slots=True)
 class CostData:
     """Cost data for a session."""
     date: str
@@ -31,50 +58,126 @@ class CostTracker:
     
     def __init__(self):
         """Initialize cost tracker."""
-        self.cost_file = Path("conversations/.cost_history.json")
-        self.cost_file.parent.mkdir(exist_ok=True)
+        # JSON Lines: one session per line, so saving is an append
+        self.cost_file = Path("conversations/.cost_history.jsonl")
+        self._dir_ready = False  # Directory is created on first save
         
         # Pricing (per 1K tokens)
         self.prompt_price = 0.0001
         self.completion_price = 0.0002
         
-        # Session tracking
+        # Per-token prices, so the hot path is a multiply instead of a divide
+        self._prompt_price_per_token = self.prompt_price / 1000
+        self._completion_price_per_token = self.completion_price / 1000
+        
+        # Session tracking (integer token counts; cost is derived from them)
         self.session_prompt_tokens = 0
         self.session_completion_tokens = 0
-        self.session_cost = 0.0
         
-        # Load history
-        self.history = self._load_history()
+        # History is loaded on first access (see the history property)
+        self._history: list[CostData] | None = None
+    
+    @property
+    def history(self) -> list[CostData]:
+        """Cost history, loaded from disk the first time it is needed."""
+        if self._history is None:
+            self._history = self._load_history()
+        return self._history
+    
+    def _ensure_cost_dir(self):
+        """Create the history directory before the first write."""
+        if not self._dir_ready:
+            self.cost_file.parent.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
     
     def _load_history(self) -> list[CostData]:
-        """Load cost history from file."""
+        """Load cost history from file, skipping lines that fail to parse."""
         if self.cost_file.exists():
             try:
-                with open(self.cost_file, 'r') as f:
-                    data = json.load(f)
-                    return [CostData(**item) for item in data]
+                text = self.cost_file.read_text(encoding='utf-8', errors='replace')
+            except OSError:
+                return []
+            
+            history = []
+            for line in text.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    history.append(CostData(**_loads(line)))
+                except (ValueError, TypeError):
+                    # A torn or malformed line (e.g. an append cut short by
+                    # Ctrl+C) only loses that one session
+                    continue
+            return history
+        
+        # Migrate the older single-array JSON history, if present
+        legacy_file = self.cost_file.with_suffix(".json")
+        if legacy_file.exists():
+            try:
+                data = _loads(legacy_file.read_text(encoding='utf-8'))
+                return [CostData(**item) for item in data]
             except Exception:
                 return []
         return []
     
+    def _append_history(self, cost_data: CostData):
+        """Append one session to the history file."""
+        try:
+            self._ensure_cost_dir()
+            legacy_file = self.cost_file.with_suffix(".json")
+            if not self.cost_file.exists() and legacy_file.exists():
+                # First save since the JSONL switch: carry the old history over
+                if self._history is None:
+                    self._history = self._load_history() + [cost_data]
+                self._save_history()
+                return
+            
+            record = (_dumps(asdict(cost_data)) + "\n").encode('utf-8')
+            with open(self.cost_file, 'a+b') as f:
+                # Start on a fresh line if the last append was cut short
+                if f.seek(0, 2) > 0:
+                    f.seek(-1, 2)
+                    if f.read(1) != b"\n":
+                        record = b"\n" + record
+                f.write(record)
+                size = f.tell()
+            
+            if size > MAX_HISTORY_BYTES:
+                self._rotate_history()
+        except Exception:
+            pass
+    
+    def _rotate_history(self):
+        """
+        Cut the history file down to its newest MAX_HISTORY_ENTRIES lines.
+        
+        Works on the raw lines rather than the parsed history, so a line
+        the loader skipped never causes valid sessions to be dropped.
+        """
+        lines = [
+            line
+            for line in self.cost_file.read_text(encoding='utf-8', errors='replace').splitlines()
+            if line.strip()
+        ][-MAX_HISTORY_ENTRIES:]
+        self._write_lines(lines)
+        if self._history is not None:
+            self._history = self._history[-MAX_HISTORY_ENTRIES:]
+    
     def _save_history(self):
-        """Save cost history to file."""
+        """Rewrite the history file, keeping only the newest entries."""
+        self._history = self.history[-MAX_HISTORY_ENTRIES:]
         try:
-            data = [
-                {
-                    "date": item.date,
-                    "prompt_tokens": item.prompt_tokens,
-                    "completion_tokens": item.completion_tokens,
-                    "total_tokens": item.total_tokens,
-                    "estimated_cost": item.estimated_cost
-                }
-                for item in self.history
-            ]
-            with open(self.cost_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._ensure_cost_dir()
+            self._write_lines([_dumps(asdict(item)) for item in self.history])
         except Exception:
             pass
     
+    def _write_lines(self, lines: list[str]):
+        """Replace the history file via a temporary file, so it is never half-written."""
+        tmp_file = self.cost_file.with_suffix(".jsonl.tmp")
+        tmp_file.write_text("".join(line + "\n" for line in lines), encoding='utf-8')
+        tmp_file.replace(self.cost_file)
+    
     def add_usage(self, prompt_tokens: int, completion_tokens: int) -> float:
         """
         Add token usage and calculate cost.
@@ -86,18 +189,26 @@ class CostTracker:
         Returns:
             float: Cost for this interaction
         """
-        # Calculate cost
-        cost = (
-            (prompt_tokens / 1000 * self.prompt_price) +
-            (completion_tokens / 1000 * self.completion_price)
-        )
-        
         # Update session
         self.session_prompt_tokens += prompt_tokens
         self.session_completion_tokens += completion_tokens
-        self.session_cost += cost
         
-        return cost
+        return (
+            prompt_tokens * self._prompt_price_per_token +
+            completion_tokens * self._completion_price_per_token
+        )
+    
+    @property
+    def session_cost(self) -> float:
+        """
+        Session cost computed from the integer token totals.
+        
+        Deriving it on read avoids float error accumulating over many calls.
+        """
+        return (
+            self.session_prompt_tokens * self._prompt_price_per_token +
+            self.session_completion_tokens * self._completion_price_per_token
+        )
     
     def get_session_cost(self) -> dict:
         """Get current session cost data."""
@@ -116,14 +227,16 @@ class CostTracker:
         """Save current session to history."""
         if self.session_prompt_tokens > 0:
             cost_data = CostData(
-                date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                date=time.strftime("%Y-%m-%d %H:%M:%S"),
                 prompt_tokens=self.session_prompt_tokens,
                 completion_tokens=self.session_completion_tokens,
                 total_tokens=self.session_prompt_tokens + self.session_completion_tokens,
                 estimated_cost=self.session_cost
             )
-            self.history.append(cost_data)
-            self._save_history()
+            # Only touch the in-memory copy if it has already been loaded
+            if self._history is not None:
+                self._history.append(cost_data)
+            self._append_history(cost_data)
     
     def format_cost_display(self) -> str:
         """Format cost information for display."""
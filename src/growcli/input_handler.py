@@ -8,6 +8,7 @@ Features:
 - Auto-completion
 """
 
+import sys
 from typing import List, Optional, Callable
 from prompt_toolkit import PromptSession
 from prompt_toolkit.history import InMemoryHistory
@@ -38,9 +39,10 @@ class EnhancedInputHandler:
             commands: List of commands for auto-completion
         """
         self.history = InMemoryHistory()
-        self.commands = commands or []
+        self.commands = list(commands or [])
+        self._command_set = set(self.commands)
         
-        # Create completer
+        # Create completer (shares the commands list, so additions show up live)
         self.completer = WordCompleter(
             self.commands,
             ignore_case=True,
@@ -155,23 +157,15 @@ class EnhancedInputHandler:
     
     def add_command(self, command: str):
         """Add a command to auto-completion."""
-        if command not in self.commands:
+        if command not in self._command_set:
+            self._command_set.add(command)
             self.commands.append(command)
-            self.completer = WordCompleter(
-                self.commands,
-                ignore_case=True,
-                sentence=True,
-            )
     
     def clear_history(self):
-        """Clear input history."""
+        """Clear input history (keeps the existing session and bindings)."""
         self.history = InMemoryHistory()
-        self.session = PromptSession(
-            history=self.history,
-            auto_suggest=AutoSuggestFromHistory(),
-            completer=self.completer,
-            key_bindings=self.bindings,
-        )
+        self.session.history = self.history
+        self.session.default_buffer.history = self.history
 
 
 # Simple fallback for systems without prompt_toolkit
@@ -181,11 +175,25 @@ class SimpleInputHandler:
     def __init__(self, commands: List[str] = None):
         """Initialize simple handler."""
         self.commands = commands or []
+        # Piped/scripted stdin skips input()'s readline setup
+        self._tty = sys.stdin.isatty()
+    
+    def _read_line(self, prompt: str) -> str:
+        """Read one line, raising EOFError at end of input like input()."""
+        if self._tty:
+            return input(prompt)
+        
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip("\n")
     
     def get_input(self, prompt: str = "👤 You: ") -> str:
         """Get simple input."""
         try:
-            return input(prompt)
+            return self._read_line(prompt)
         except (KeyboardInterrupt, EOFError):
             return '/quit'
     
@@ -197,7 +205,7 @@ class SimpleInputHandler:
         
         try:
             while True:
-                line = input("   ")
+                line = self._read_line("   ")
                 if line.strip() == "":
                     empty_count += 1
                     if empty_count >= 2:
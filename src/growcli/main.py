@@ -10,36 +10,29 @@ Provides the interactive terminal chat loop with advanced features:
 - Progress indicators
 """
 
+from __future__ import annotations
+
 import sys
-import atexit
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
 from growcli import __version__, __app_name__
-from growcli.config import load_settings
-from growcli.chat_engine import ChatEngine
-from growcli.prompts import WELCOME_MESSAGE, HELP_TEXT
 from growcli.utils import (
     print_bot_response,
     print_error,
     print_info,
-    print_welcome,
     console,
 )
 
-# Import new modules
-from growcli.conversation_manager import ConversationManager
-from growcli.templates import TemplateManager
-from growcli.input_handler import create_input_handler
-from growcli.syntax_highlighter import SyntaxHighlighter
-
+# Heavier modules are imported inside app() once the banner is on screen
+if TYPE_CHECKING:
+    from growcli.chat_engine import ChatEngine
+    from growcli.conversation_manager import ConversationManager
+    from growcli.templates import TemplateManager
+    from growcli.syntax_highlighter import SyntaxHighlighter
 
-# Commands that trigger special actions
-QUIT_COMMANDS = {"/quit", "/exit", "/q"}
 
 # Global instances (initialized in app())
 conversation_manager: ConversationManager = None
@@ -48,138 +41,7 @@ input_handler = None
 syntax_highlighter: SyntaxHighlighter = None
 
 
-def handle_command(
-    command: str,
-    engine: ChatEngine,
-) -> bool:
-    """
-    Handle slash commands with enhanced features.
-
-    Args:
-        command: The command string (e.g., "/help").
-        engine: The chat engine instance.
-
-    Returns:
-        bool: True if the app should continue, False to quit.
-    """
-    global conversation_manager, template_manager, syntax_highlighter
-    
-    parts = command.strip().split(maxsplit=1)
-    cmd = parts[0].lower()
-    args = parts[1] if len(parts) > 1 else ""
-
-    # ═══════════════════════════════════════════════════════════
-    # Basic Commands
-    # ═══════════════════════════════════════════════════════════
-    
-    if cmd in QUIT_COMMANDS:
-        return False
-
-    elif cmd == "/help" or cmd == "/h":
-        show_help()
-
-    elif cmd == "/clear" or cmd == "/c":
-        engine.clear_history()
-        conversation_manager.current_conversation = []
-        console.clear()
-        print_info("🧹 Conversation history cleared. Starting fresh!")
-
-    elif cmd == "/history":
-        print_info(engine.get_history_display())
-
-    elif cmd == "/model" or cmd == "/m":
-        print_info(engine.get_model_info())
-
-    elif cmd == "/stats" or cmd == "/s":
-        print_info(f"\n{conversation_manager.get_conversation_summary()}")
-
-    # ═══════════════════════════════════════════════════════════
-    # Conversation Management Commands
-    # ═══════════════════════════════════════════════════════════
-    
-    elif cmd == "/save":
-        format_type = args.lower() if args else "json"
-        
-        if format_type == "json":
-            filepath = conversation_manager.save_json()
-        elif format_type in ["md", "markdown"]:
-            filepath = conversation_manager.save_markdown()
-        elif format_type in ["txt", "text"]:
-            filepath = conversation_manager.save_text()
-        else:
-            print_error(f"Unknown format: {format_type}. Use: json, md, or txt")
-            return True
-        
-        print_info(f"💾 Conversation saved to: {filepath}")
-
-    elif cmd == "/load":
-        if not args:
-            conversations = conversation_manager.list_conversations()
-            if conversations:
-                print_info("\n📂 Available conversations:")
-                for i, conv in enumerate(conversations[:10], 1):
-                    print_info(f"  {i}. {Path(conv).name}")
-                print_info("\n💡 Usage: /load <filename>")
-            else:
-                print_info("No saved conversations found.")
-        else:
-            filepath = args if "/" in args or "\\" in args else f"conversations/{args}"
-            if conversation_manager.load_conversation(filepath):
-                for msg in conversation_manager.current_conversation:
-                    if msg.role in ["user", "assistant"]:
-                        from growcli.chat_engine import Message
-                        engine.history.append(Message(role=msg.role, content=msg.content))
-
-    elif cmd == "/list":
-        conversations = conversation_manager.list_conversations()
-        if conversations:
-            table = Table(title="📂 Saved Conversations")
-            table.add_column("#", style="cyan")
-            table.add_column("Filename", style="green")
-            
-            for i, conv in enumerate(conversations[:20], 1):
-                path = Path(conv)
-                table.add_row(str(i), path.name)
-            
-            console.print(table)
-        else:
-            print_info("No saved conversations found.")
-
-    # ═══════════════════════════════════════════════════════════
-    # Template Commands
-    # ═══════════════════════════════════════════════════════════
-    
-    elif cmd == "/template" or cmd == "/t":
-        if not args:
-            console.print(template_manager.format_template_list())
-        else:
-            template = template_manager.get_template(args)
-            if template:
-                print_info(f"📋 Using template: {template.name}")
-                print_info(f"   {template.description}\n")
-                return True
-            else:
-                print_error(f"Template not found: {args}")
-
-    elif cmd == "/templates":
-        print_info(template_manager.format_template_list())
-
-    # ═══════════════════════════════════════════════════════════
-    # UI Commands
-    # ═══════════════════════════════════════════════════════════
-    
-    elif cmd == "/cls" or cmd == "/clear-screen":
-        console.clear()
-
-    else:
-        print_error(f"Unknown command: {cmd}. Type /help for available commands.")
-
-    return True
-
-
-def show_help():
-    """Display clean, professional help message."""
-    help_text = """
+_HELP_TEXT = """
 [bold cyan]═══════════════════════════════════════════════════════════════════[/bold cyan]
 [bold cyan]                    GroqCLI-Chatbot Commands                        [/bold cyan]
 [bold cyan]═══════════════════════════════════════════════════════════════════[/bold cyan]
@@ -195,8 +57,8 @@ def show_help():
   /t <name>              Short form
 
 [bold yellow]Conversation:[/bold yellow]
-  /save [format]         Save conversation (json/md/txt)
-  /load [file]           Load conversation
+  /save \\[format]         Save conversation (json/md/txt)
+  /load \\[file]           Load conversation
   /list                  List saved conversations
 
 [bold yellow]Info:[/bold yellow]
@@ -214,7 +76,193 @@ def show_help():
 [dim]💡 Tip: End line with \\ to continue on next line[/dim]
 [bold cyan]═══════════════════════════════════════════════════════════════════[/bold cyan]
 """
-    console.print(help_text)
+
+# Separator between chat sections
+_SEP = "─" * 70
+
+# Shown once under the banner
+_QUICK_COMMANDS = (
+    "\n[bold cyan]Quick Commands:[/bold cyan]\n"
+    "  [cyan]/templates[/cyan] - View templates  |  [cyan]/help[/cyan] - All commands  |  [cyan]/quit[/cyan] - Exit\n"
+    f"\n{_SEP}\n"
+)
+
+# Parsed and highlighted once at import so /help skips re-running the markup parser
+_HELP_RENDERABLE = console.render_str(_HELP_TEXT)
+
+
+# ═══════════════════════════════════════════════════════════
+# Command Handlers
+#
+# Each handler takes (engine, args) and returns True to keep the
+# app running or False to quit.
+# ═══════════════════════════════════════════════════════════
+
+def _cmd_quit(engine: ChatEngine, args: str) -> bool:
+    return False
+
+
+def _cmd_help(engine: ChatEngine, args: str) -> bool:
+    show_help()
+    return True
+
+
+def _cmd_clear(engine: ChatEngine, args: str) -> bool:
+    engine.clear_history()
+    conversation_manager.current_conversation = []
+    console.clear()
+    print_info("🧹 Conversation history cleared. Starting fresh!")
+    return True
+
+
+def _cmd_history(engine: ChatEngine, args: str) -> bool:
+    print_info(engine.get_history_display())
+    return True
+
+
+def _cmd_model(engine: ChatEngine, args: str) -> bool:
+    print_info(engine.get_model_info())
+    return True
+
+
+def _cmd_stats(engine: ChatEngine, args: str) -> bool:
+    print_info(f"\n{conversation_manager.get_conversation_summary()}")
+    return True
+
+
+def _cmd_save(engine: ChatEngine, args: str) -> bool:
+    format_type = args.lower() if args else "json"
+    
+    if format_type == "json":
+        filepath = conversation_manager.save_json()
+    elif format_type in ["md", "markdown"]:
+        filepath = conversation_manager.save_markdown()
+    elif format_type in ["txt", "text"]:
+        filepath = conversation_manager.save_text()
+    else:
+        print_error(f"Unknown format: {format_type}. Use: json, md, or txt")
+        return True
+    
+    print_info(f"💾 Conversation saved to: {filepath}")
+    return True
+
+
+def _cmd_load(engine: ChatEngine, args: str) -> bool:
+    if not args:
+        conversations = conversation_manager.list_conversations()
+        if conversations:
+            print_info("\n📂 Available conversations:")
+            for i, conv in enumerate(conversations[:10], 1):
+                print_info(f"  {i}. {Path(conv).name}")
+            print_info("\n💡 Usage: /load <filename>")
+        else:
+            print_info("No saved conversations found.")
+    else:
+        filepath = args if "/" in args or "\\" in args else f"conversations/{args}"
+        if conversation_manager.load_conversation(filepath):
+            from growcli.chat_engine import Message
+            
+            engine.history.extend(
+                Message(role=msg.role, content=msg.content)
+                for msg in conversation_manager.current_conversation
+                if msg.role in _VALID_ROLES
+            )
+    return True
+
+
+def _cmd_list(engine: ChatEngine, args: str) -> bool:
+    from rich.table import Table
+    
+    conversations = conversation_manager.list_conversations()
+    if conversations:
+        table = Table(title="📂 Saved Conversations")
+        table.add_column("#", style="cyan")
+        table.add_column("Filename", style="green")
+        
+        for i, conv in enumerate(conversations[:20], 1):
+            path = Path(conv)
+            table.add_row(str(i), path.name)
+        
+        console.print(table)
+    else:
+        print_info("No saved conversations found.")
+    return True
+
+
+def _cmd_template(engine: ChatEngine, args: str) -> bool:
+    if not args:
+        console.print(template_manager.format_template_list())
+    else:
+        template = template_manager.get_template(args)
+        if template:
+            # The chat loop applies /t <name> itself, so this is only
+            # reached from the template question prompt
+            print_error("Finish the current template question before choosing another template.")
+        else:
+            print_error(f"Template not found: {args}")
+    return True
+
+
+def _cmd_templates(engine: ChatEngine, args: str) -> bool:
+    print_info(template_manager.format_template_list())
+    return True
+
+
+def _cmd_clear_screen(engine: ChatEngine, args: str) -> bool:
+    console.clear()
+    return True
+
+
+# Message roles replayed into the engine history by /load
+_VALID_ROLES = frozenset({"user", "assistant"})
+
+# Aliases that apply a template to the next question in the chat loop
+_TEMPLATE_ALIASES = frozenset({"/t", "/template"})
+
+# Jump table: every alias maps straight to its handler
+_COMMANDS: dict[str, Callable[[ChatEngine, str], bool]] = {}
+_COMMANDS["/quit"] = _COMMANDS["/exit"] = _COMMANDS["/q"] = _cmd_quit
+_COMMANDS["/help"] = _COMMANDS["/h"] = _cmd_help
+_COMMANDS["/clear"] = _COMMANDS["/c"] = _cmd_clear
+_COMMANDS["/history"] = _cmd_history
+_COMMANDS["/model"] = _COMMANDS["/m"] = _cmd_model
+_COMMANDS["/stats"] = _COMMANDS["/s"] = _cmd_stats
+_COMMANDS["/save"] = _cmd_save
+_COMMANDS["/load"] = _cmd_load
+_COMMANDS["/list"] = _cmd_list
+_COMMANDS["/template"] = _COMMANDS["/t"] = _cmd_template
+_COMMANDS["/templates"] = _cmd_templates
+_COMMANDS["/cls"] = _COMMANDS["/clear-screen"] = _cmd_clear_screen
+
+
+def handle_command(
+    command: str,
+    engine: ChatEngine,
+) -> bool:
+    """
+    Handle slash commands with enhanced features.
+
+    Args:
+        command: The command string (e.g., "/help").
+        engine: The chat engine instance.
+
+    Returns:
+        bool: True if the app should continue, False to quit.
+    """
+    cmd, _, args = command.strip().partition(" ")
+    cmd = cmd.lower()
+
+    handler = _COMMANDS.get(cmd)
+    if handler is None:
+        print_error(f"Unknown command: {cmd}. Type /help for available commands.")
+        return True
+
+    return handler(engine, args.lstrip())
+
+
+def show_help():
+    """Display clean, professional help message."""
+    console.print(_HELP_RENDERABLE)
 
 
 @click.command()
@@ -246,8 +294,13 @@ def app(model: str | None, temperature: float | None, no_highlight: bool) -> Non
     # Show beautiful banner (clean, no extra text)
     show_animated_banner()
     
-    # Simple loading - no verbose output
-    import time
+    # Deferred imports: their load time is hidden behind the first frame
+    from growcli.config import load_settings
+    from growcli.chat_engine import ChatEngine
+    from growcli.conversation_manager import ConversationManager
+    from growcli.templates import TemplateManager
+    from growcli.input_handler import create_input_handler
+    from growcli.syntax_highlighter import SyntaxHighlighter
     
     # Load configuration silently
     settings = load_settings()
@@ -270,20 +323,8 @@ def app(model: str | None, temperature: float | None, no_highlight: bool) -> Non
     ])
     syntax_highlighter = SyntaxHighlighter() if not no_highlight else None
     
-    # Register auto-save on exit
-    def auto_save_on_exit():
-        if len(conversation_manager.current_conversation) > 0:
-            conversation_manager.auto_save()
-    
-    atexit.register(auto_save_on_exit)
-
     # ── Display Simple Help Commands ─────────────────
-    console.print()
-    console.print("[bold cyan]Quick Commands:[/bold cyan]")
-    console.print("  [cyan]/templates[/cyan] - View templates  |  [cyan]/help[/cyan] - All commands  |  [cyan]/quit[/cyan] - Exit")
-    console.print()
-    console.print("─" * 70)
-    console.print()
+    console.print(_QUICK_COMMANDS)
 
     # ── Main Chat Loop ──────────────────────────────────────────
     try:
@@ -295,26 +336,33 @@ def app(model: str | None, temperature: float | None, no_highlight: bool) -> Non
             if not user_input or not user_input.strip():
                 continue
 
+            # Check if using template (/t <name> or /template <name>)
+            head, sep, rest = user_input.partition(" ")
+            template = (
+                template_manager.get_template(rest.strip())
+                if sep and head.lower() in _TEMPLATE_ALIASES
+                else None
+            )
+
+            if template:
+                print_info(f"📋 Using template: {template.name}")
+                question = input_handler.get_input("   Your question: ")
+                if not question or not question.strip():
+                    continue
+                # Ctrl+C/Ctrl+D and end of piped input come back as /quit
+                if question.startswith("/"):
+                    if not handle_command(question, engine):
+                        break
+                    continue
+                user_input = f"{template.prompt}\n\n{question}"
+
             # Handle slash commands
-            if user_input.startswith("/"):
+            elif user_input.startswith("/"):
                 should_continue = handle_command(user_input, engine)
                 if not should_continue:
                     break
                 continue
 
-            # Check if using template
-            active_template = None
-            if user_input.startswith("/t ") or user_input.startswith("/template "):
-                parts = user_input.split(maxsplit=1)
-                if len(parts) > 1:
-                    template = template_manager.get_template(parts[1])
-                    if template:
-                        active_template = template
-                        user_input = input_handler.get_input("   [dim]Your question:[/dim] ")
-                        if not user_input:
-                            continue
-                        user_input = f"{template.prompt}\n\n{user_input}"
-
             # ── Send to AI and get response ─────────────────────
             response_text, metrics = engine.send_message(user_input)
 
@@ -333,14 +381,17 @@ def app(model: str | None, temperature: float | None, no_highlight: bool) -> Non
             )
 
             # Display the response with clean, structured formatting
-            if syntax_highlighter and "```" in response_text:
+            if syntax_highlighter and metrics.has_code_blocks:
                 # Response has code blocks - use structured format
-                console.print(f"\n[bold green]🤖 {settings.chatbot_name}[/bold green] [dim]({metrics.latency_seconds:.2f}s)[/dim]")
-                console.print("─" * 70)
-                console.print()
+                console.print(
+                    f"\n[bold green]🤖 {settings.chatbot_name}[/bold green] "
+                    f"[dim]({metrics.latency_seconds:.2f}s)[/dim]\n{_SEP}\n"
+                )
                 syntax_highlighter.format_response(response_text)
-                console.print("─" * 70)
-                console.print(f"[dim]💡 Tokens: {metrics.total_tokens} | Latency: {metrics.latency_seconds:.2f}s[/dim]\n")
+                console.print(
+                    f"{_SEP}\n"
+                    f"[dim]💡 Tokens: {metrics.total_tokens} | Latency: {metrics.latency_seconds:.2f}s[/dim]\n"
+                )
             else:
                 # Plain text response - use simple panel
                 print_bot_response(
@@ -352,13 +403,14 @@ def app(model: str | None, temperature: float | None, no_highlight: bool) -> Non
     except KeyboardInterrupt:
         console.print("\n")
 
+    finally:
+        # Auto-save exactly once, even if the loop died on an error
+        if conversation_manager.current_conversation:
+            conversation_manager.auto_save()
+
     # ── Cleanup ─────────────────────────────────────────────────
-    console.print("\n[bold cyan]═══════════════════════════════════════════════════════[/bold cyan]")
-    print_info(f"\n{conversation_manager.get_conversation_summary()}")
-    
-    # Auto-save
-    if len(conversation_manager.current_conversation) > 0:
-        conversation_manager.auto_save()
+    from rich.console import Group
+    from rich.panel import Panel
     
     goodbye_panel = Panel(
         f"[bold cyan]Thank you for using GroqCLI-Chatbot![/bold cyan]\n\n"
@@ -373,8 +425,13 @@ def app(model: str | None, temperature: float | None, no_highlight: bool) -> Non
         border_style="cyan",
         padding=(1, 2),
     )
-    console.print(goodbye_panel)
-    console.print()
+    # Summary and goodbye go out in a single write
+    console.print(Group(
+        "\n[bold cyan]═══════════════════════════════════════════════════════[/bold cyan]",
+        f"[info]\n{conversation_manager.get_conversation_summary()}[/info]",
+        goodbye_panel,
+        "",
+    ))
 
 
 if __name__ == "__main__":
@@ -48,6 +48,10 @@ class ModelSelector:
                 "context": "8K tokens"
             },
         ]
+        
+        # Lookup indexes by model id
+        self._by_id = {m["id"]: m for m in self.models}
+        self._id_to_index = {m["id"]: i for i, m in enumerate(self.models)}
     
     def show_models(self) -> None:
         """Display available models in a table."""
@@ -86,13 +90,8 @@ class ModelSelector:
         Returns:
             str: Selected model ID
         """
-        # Find default index
-        default_idx = 1
-        if default:
-            for i, model in enumerate(self.models, 1):
-                if model["id"] == default:
-                    default_idx = i
-                    break
+        # Find default index (1-based; first model if unknown)
+        default_idx = self._id_to_index.get(default, 0) + 1
         
         self.show_models()
         
@@ -120,7 +119,4 @@ class ModelSelector:
     
     def get_model_info(self, model_id: str) -> dict:
         """Get information about a model."""
-        for model in self.models:
-            if model["id"] == model_id:
-                return model
-        return self.models[0]  # Default
+        return self._by_id.get(model_id, self.models[0])  # Default: first model
@@ -4,11 +4,16 @@ Prompt templates for GroqCLI-Chatbot.
 Centralizes all system prompts and makes personality tweaking easy.
 """
 
+from functools import lru_cache
 
+
+@lru_cache(maxsize=8)
 def get_system_prompt(bot_name: str) -> str:
     """
     Generate the system prompt that defines the chatbot's personality.
 
+    Memoized per bot name, so repeated engines reuse the same string.
+
     Args:
         bot_name: The name the chatbot uses to identify itself.
 
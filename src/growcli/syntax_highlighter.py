@@ -4,15 +4,46 @@ Syntax highlighting for code blocks in GroqCLI-Chatbot responses.
 Provides beautiful, structured code formatting with clear separation.
 """
 
-import re
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Union
+
+from pygments.lexer import Lexer
+from pygments.lexers import get_lexer_by_name
+from pygments.util import ClassNotFound
 from rich.console import Console
+from rich.markup import escape
 from rich.syntax import Syntax
 from rich.panel import Panel
-from rich.markdown import Markdown
+
+from growcli.utils import render_markdown, iter_blocks
 
 console = Console()
 
+# Separator rule for plain code blocks, built once
+_SEP60 = "─" * 60
+
+# Lowercase language names rendered with highlighting; others fall back to text
+_SUPPORTED_LANGS = frozenset({
+    'python', 'javascript', 'java', 'c', 'cpp', 'csharp',
+    'go', 'rust', 'ruby', 'php', 'swift', 'kotlin',
+    'typescript', 'html', 'css', 'sql', 'bash', 'shell',
+    'json', 'yaml', 'xml', 'markdown'
+})
+
+
+@lru_cache(maxsize=32)
+def _get_lexer(language: str) -> Union[Lexer, str]:
+    """
+    Look up the Pygments lexer for a language once and reuse it.
+    
+    Uses the same options Rich's Syntax passes for a lexer name; unknown names
+    are returned unchanged so Syntax falls back to plain text as before.
+    """
+    try:
+        return get_lexer_by_name(language, stripnl=False, ensurenl=True, tabsize=4)
+    except ClassNotFound:
+        return language
+
 
 class SyntaxHighlighter:
     """
@@ -22,12 +53,7 @@ class SyntaxHighlighter:
     
     def __init__(self):
         """Initialize the syntax highlighter."""
-        self.supported_languages = {
-            'python', 'javascript', 'java', 'c', 'cpp', 'csharp',
-            'go', 'rust', 'ruby', 'php', 'swift', 'kotlin',
-            'typescript', 'html', 'css', 'sql', 'bash', 'shell',
-            'json', 'yaml', 'xml', 'markdown'
-        }
+        self.supported_languages = _SUPPORTED_LANGS
     
     def format_response(self, text: str) -> None:
         """
@@ -36,23 +62,13 @@ class SyntaxHighlighter:
         Args:
             text: The response text with potential code blocks
         """
-        # Split by code blocks (```language ... ```)
-        parts = re.split(r'```(\w+)?\n(.*?)```', text, flags=re.DOTALL)
-        
-        for i, part in enumerate(parts):
-            if i % 3 == 0:
-                # Regular text (not code)
-                if part.strip():
-                    # Use Markdown for better formatting
-                    md = Markdown(part.strip())
-                    console.print(md)
-                    console.print()  # Add spacing
-            elif i % 3 == 1:
-                # Language identifier
-                language = part.lower() if part else 'text'
-            elif i % 3 == 2:
-                # Code block
-                self._print_code_block(part, language)
+        for kind, content, language in iter_blocks(text):
+            if kind == 'code':
+                self._print_code_block(content, language)
+            else:
+                # Use Markdown for better formatting
+                console.print(render_markdown(content))
+                console.print()  # Add spacing
     
     def _print_code_block(self, code: str, language: str) -> None:
         """
@@ -75,7 +91,7 @@ class SyntaxHighlighter:
         # Create syntax-highlighted code
         syntax = Syntax(
             code,
-            language,
+            _get_lexer(language),
             theme="monokai",
             line_numbers=True,
             word_wrap=False,
@@ -102,31 +118,44 @@ class SyntaxHighlighter:
         Args:
             text: The response text
         """
-        # Split by code blocks
-        parts = re.split(r'```(\w+)?\n(.*?)```', text, flags=re.DOTALL)
+        for kind, content, _ in iter_blocks(text):
+            if kind == 'code':
+                self._print_plain_code(content)
+            else:
+                console.print(content)
+                console.print()
+    
+    def _print_plain_code(self, code: str) -> None:
+        """
+        Print a code block with line numbers but no highlighting.
+        
+        Args:
+            code: The stripped code to print
+        """
+        if not code:
+            return
         
-        for i, part in enumerate(parts):
-            if i % 3 == 0:
-                # Regular text
-                if part.strip():
-                    console.print(part.strip())
-                    console.print()
-            elif i % 3 == 2:
-                # Code block (no highlighting)
-                code = part.strip()
-                if code:
-                    # Print with clear separation
-                    console.print("\n" + "─" * 60)
-                    console.print(f"[bold cyan]CODE:[/bold cyan]")
-                    console.print("─" * 60)
-                    
-                    # Print code with line numbers
-                    for line_num, line in enumerate(code.split('\n'), 1):
-                        console.print(f"{line_num:3d} | {line}")
-                    
-                    console.print("─" * 60)
-                    console.print("[dim]Select and copy with mouse[/dim]")
-                    console.print("─" * 60 + "\n")
+        # Code with line numbers, built up and printed in one write
+        numbered = "\n".join(
+            f"{line_num:3d} | {escape(line)}"
+            for line_num, line in enumerate(code.split('\n'), 1)
+        )
+        console.print(
+            f"\n{_SEP60}\n[bold cyan]CODE:[/bold cyan]\n{_SEP60}\n"
+            f"{numbered}\n{_SEP60}\n"
+            f"[dim]Select and copy with mouse[/dim]\n{_SEP60}\n"
+        )
+
+
+# Keyword heuristics for detect_language, in priority order:
+# (language, substrings, case-insensitive)
+_LANG_KEYWORDS = (
+    ('python', ('def ', 'import ', 'print('), False),
+    ('javascript', ('function ', 'const ', 'let '), False),
+    ('java', ('public class', 'public static void'), False),
+    ('cpp', ('#include',), False),
+    ('sql', ('SELECT ', 'FROM '), True),
+)
 
 
 def detect_language(code: str) -> str:
@@ -139,16 +168,16 @@ def detect_language(code: str) -> str:
     Returns:
         str: Detected language or 'text'
     """
-    # Simple heuristics
-    if 'def ' in code or 'import ' in code or 'print(' in code:
-        return 'python'
-    elif 'function ' in code or 'const ' in code or 'let ' in code:
-        return 'javascript'
-    elif 'public class' in code or 'public static void' in code:
-        return 'java'
-    elif '#include' in code:
-        return 'cpp'
-    elif 'SELECT ' in code.upper() or 'FROM ' in code.upper():
-        return 'sql'
-    else:
-        return 'text'
+    # Simple heuristics; substring checks use CPython's fast search
+    upper = None  # Uppercase copy, made once and only if needed
+    for language, keywords, ignore_case in _LANG_KEYWORDS:
+        if ignore_case:
+            if upper is None:
+                upper = code.upper()
+            haystack = upper
+        else:
+            haystack = code
+        for keyword in keywords:
+            if keyword in haystack:
+                return language
+    return 'text'
@@ -4,11 +4,18 @@ Utility functions for GroqCLI-Chatbot.
 Provides text formatting, display helpers, and structured output.
 """
 
-from rich.console import Console
-from rich.markdown import Markdown
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from rich.console import Console, Group
+from rich.markup import escape
 from rich.panel import Panel
 from rich.theme import Theme
 
+if TYPE_CHECKING:
+    from rich.markdown import Markdown
+
 # Custom theme for consistent styling
 CUSTOM_THEME = Theme({
     "user": "cyan",
@@ -20,6 +27,57 @@ CUSTOM_THEME = Theme({
 
 console = Console(theme=CUSTOM_THEME)
 
+# Fenced code blocks: ```language\n<code>```
+_CODE_BLOCK_RE = re.compile(r'```(\w+)?\n(.*?)```', re.DOTALL)
+
+# Separator rules, built once
+_SEP70 = "─" * 70
+_SEP_EQ70 = "═" * 70
+
+
+def iter_blocks(text: str) -> Iterator[tuple[str, str, Optional[str]]]:
+    """
+    Split a response into its text and fenced code segments, in order.
+    
+    Args:
+        text: The response text
+        
+    Yields:
+        ('text', stripped_text, None) for non-blank text segments and
+        ('code', stripped_code, language) for code blocks, with the language
+        lowercased and defaulting to 'text'
+    """
+    # re.split yields leading text, then (language, code, text) triples.
+    # Blank segments are skipped with isspace(), which doesn't copy like strip()
+    parts = _CODE_BLOCK_RE.split(text)
+    head = parts[0]
+    if head and not head.isspace():
+        yield 'text', head.strip(), None
+    for language, code, tail in zip(parts[1::3], parts[2::3], parts[3::3]):
+        yield 'code', code.strip(), language.lower() if language else 'text'
+        if tail and not tail.isspace():
+            yield 'text', tail.strip(), None
+
+
+@lru_cache(maxsize=256)
+def render_markdown(text: str) -> "Markdown":
+    """Return a parsed Markdown renderable, reused for repeated text."""
+    # Imported on first use; rich.markdown is slow to load at startup
+    from rich.markdown import Markdown
+    
+    return Markdown(text)
+
+
+def _numbered_lines(code: str) -> str:
+    """Return code as markup lines prefixed with dimmed line numbers."""
+    lines = code.split('\n')
+    # At least 3 columns, widened so long blocks stay aligned past line 999
+    width = max(3, len(str(len(lines))))
+    return "\n".join(
+        f"[dim]{line_num:>{width}}[/dim] │ {escape(line)}"
+        for line_num, line in enumerate(lines, 1)
+    )
+
 
 def print_bot_response(text: str, bot_name: str, latency: float) -> None:
     """
@@ -31,7 +89,7 @@ def print_bot_response(text: str, bot_name: str, latency: float) -> None:
         latency: Response time in seconds
     """
     # Use Markdown for better structure
-    md = Markdown(text)
+    md = render_markdown(text)
     
     # Create panel with clear structure
     panel = Panel(
@@ -56,47 +114,32 @@ def print_structured_response(text: str, bot_name: str, latency: float) -> None:
         bot_name: Bot name
         latency: Response time
     """
-    import re
-    
     # Check if response has code blocks
     has_code = '```' in text
     
     if has_code:
-        # Print header
-        console.print(f"\n[bold green]🤖 {bot_name}[/bold green] [dim]({latency:.2f}s)[/dim]")
-        console.print("─" * 70)
-        console.print()
+        # Collect header, segments and footer, then render them in one print
+        items = [
+            f"\n[bold green]🤖 {bot_name}[/bold green] [dim]({latency:.2f}s)[/dim]\n"
+            f"{_SEP70}\n"
+        ]
         
-        # Split by code blocks
-        parts = re.split(r'```(\w+)?\n(.*?)```', text, flags=re.DOTALL)
+        for kind, content, language in iter_blocks(text):
+            if kind == 'text':
+                items.append(render_markdown(content))
+                items.append("")
+            elif content:
+                # Line numbers for easy copying
+                items.append(
+                    f"[bold cyan]📝 {language.upper()} Code:[/bold cyan]\n"
+                    f"{_SEP70}\n"
+                    f"{_numbered_lines(content)}\n"
+                    f"{_SEP70}\n"
+                    "[dim]💡 Tip: Select with mouse to copy[/dim]\n"
+                )
         
-        for i, part in enumerate(parts):
-            if i % 3 == 0:
-                # Regular text
-                if part.strip():
-                    md = Markdown(part.strip())
-                    console.print(md)
-                    console.print()
-            elif i % 3 == 1:
-                # Language identifier (stored for next part)
-                language = part if part else 'text'
-            elif i % 3 == 2:
-                # Code block
-                code = part.strip()
-                if code:
-                    console.print(f"[bold cyan]📝 {language.upper()} Code:[/bold cyan]")
-                    console.print("─" * 70)
-                    
-                    # Print with line numbers for easy copying
-                    for line_num, line in enumerate(code.split('\n'), 1):
-                        console.print(f"[dim]{line_num:3d}[/dim] │ {line}")
-                    
-                    console.print("─" * 70)
-                    console.print("[dim]💡 Tip: Select with mouse to copy[/dim]")
-                    console.print()
-        
-        console.print("─" * 70)
-        console.print()
+        items.append(f"{_SEP70}\n")
+        console.print(Group(*items))
     else:
         # No code blocks, use simple panel
         print_bot_response(text, bot_name, latency)
@@ -124,9 +167,9 @@ def print_welcome(welcome_text: str) -> None:
 
 def print_section_header(title: str) -> None:
     """Print a section header for better structure."""
-    console.print(f"\n[bold cyan]{'═' * 70}[/bold cyan]")
+    console.print(f"\n[bold cyan]{_SEP_EQ70}[/bold cyan]")
     console.print(f"[bold cyan]{title}[/bold cyan]")
-    console.print(f"[bold cyan]{'═' * 70}[/bold cyan]\n")
+    console.print(f"[bold cyan]{_SEP_EQ70}[/bold cyan]\n")
 
 
 def print_code_block(code: str, language: str = "text") -> None:
@@ -137,14 +180,13 @@ def print_code_block(code: str, language: str = "text") -> None:
         code: Code to display
         language: Programming language
     """
-    console.print(f"\n[bold cyan]📝 {language.upper()} Code:[/bold cyan]")
-    console.print("─" * 70)
-    
-    for line_num, line in enumerate(code.split('\n'), 1):
-        console.print(f"[dim]{line_num:3d}[/dim] │ {line}")
-    
-    console.print("─" * 70)
-    console.print("[dim]💡 Select with mouse to copy[/dim]\n")
+    console.print(
+        f"\n[bold cyan]📝 {escape(language.upper())} Code:[/bold cyan]\n"
+        f"{_SEP70}\n"
+        f"{_numbered_lines(code)}\n"
+        f"{_SEP70}\n"
+        "[dim]💡 Select with mouse to copy[/dim]\n"
+    )
 
 
 def get_user_input(bot_name: str) -> str:
@@ -159,13 +201,15 @@ def get_user_input(bot_name: str) -> str:
         str: The complete user input
     """
     try:
-        lines = []
-        prompt = "\n👤 You: "
+        line = console.input("\n👤 You: ")
+        if not line.endswith("\\"):
+            return line.strip()  # Common single-line case
+        
+        lines = [line[:-1]]  # Remove the backslash
         while True:
-            line = console.input(prompt)
+            line = console.input("   ... ")  # Continuation prompt
             if line.endswith("\\"):
-                lines.append(line[:-1])  # Remove the backslash
-                prompt = "   ... "  # Continuation prompt
+                lines.append(line[:-1])
             else:
                 lines.append(line)
                 break
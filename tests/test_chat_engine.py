@@ -23,7 +23,7 @@ def mock_settings():
 class TestChatEngine:
     """Test the ChatEngine class."""
 
-    @patch("growcli.chat_engine.Groq")
+    @patch("groq.Groq")
     def test_initialization(self, mock_groq_class, mock_settings):
         """Engine should initialize with correct settings."""
         engine = ChatEngine(mock_settings)
@@ -32,7 +32,7 @@ class TestChatEngine:
         assert engine.max_tokens == 512
         assert len(engine.history) == 0
 
-    @patch("growcli.chat_engine.Groq")
+    @patch("groq.Groq")
     def test_clear_history(self, mock_groq_class, mock_settings):
         """Clearing history should empty the list."""
         engine = ChatEngine(mock_settings)
@@ -43,7 +43,7 @@ class TestChatEngine:
         engine.clear_history()
         assert len(engine.history) == 0
 
-    @patch("growcli.chat_engine.Groq")
+    @patch("groq.Groq")
     def test_build_messages_includes_system(self, mock_groq_class, mock_settings):
         """Built messages should always start with system prompt."""
         engine = ChatEngine(mock_settings)
@@ -51,7 +51,7 @@ class TestChatEngine:
         assert messages[0]["role"] == "system"
         assert "TestBot" in messages[0]["content"]
 
-    @patch("growcli.chat_engine.Groq")
+    @patch("groq.Groq")
     def test_history_trimming(self, mock_groq_class, mock_settings):
         """History should be trimmed to max_history."""
         mock_settings.max_history = 4
@@ -66,26 +66,97 @@ class TestChatEngine:
         # Should have: 1 system + 4 history (max_history) = 5
         assert len(messages) == 5
 
-    @patch("growcli.chat_engine.Groq")
+    @patch("groq.Groq")
+    def test_history_trimming_with_pending_message(self, mock_groq_class, mock_settings):
+        """A pending user message counts toward the max_history window."""
+        mock_settings.max_history = 4
+        engine = ChatEngine(mock_settings)
+
+        for i in range(6):
+            role = "user" if i % 2 == 0 else "assistant"
+            engine.history.append(Message(role=role, content=f"msg {i}"))
+
+        messages = engine._build_messages(Message(role="user", content="next"))
+        # 1 system + last 3 history + the pending message = 5
+        assert len(messages) == 5
+        assert messages[1]["content"] == "msg 3"
+        assert messages[-1]["content"] == "next"
+        assert len(engine.history) == 6
+
+    @patch("groq.Groq")
+    def test_send_message_failure_keeps_history(self, mock_groq_class, mock_settings):
+        """A failed call should leave the existing history untouched."""
+        mock_client = MagicMock()
+        mock_groq_class.return_value = mock_client
+        mock_client.chat.completions.create.side_effect = RuntimeError("boom")
+
+        mock_settings.max_history = 4
+        engine = ChatEngine(mock_settings)
+        for i in range(4):
+            role = "user" if i % 2 == 0 else "assistant"
+            engine.history.append(Message(role=role, content=f"msg {i}"))
+        before = list(engine.history)
+
+        response, metrics = engine.send_message("Hi there!")
+
+        assert "boom" in response
+        assert metrics.total_tokens == 0
+        assert engine.history == before
+
+    @patch("groq.Groq")
     def test_send_message_success(self, mock_groq_class, mock_settings):
         """Successful API call should return response and metrics."""
         # Mock the Groq client
         mock_client = MagicMock()
         mock_groq_class.return_value = mock_client
 
-        # Mock the API response
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Hello! How can I help?"
-        mock_response.usage.prompt_tokens = 50
-        mock_response.usage.completion_tokens = 10
-        mock_response.usage.total_tokens = 60
-        mock_client.chat.completions.create.return_value = mock_response
+        # Mock the streamed API response
+        def make_chunk(content, usage=None):
+            chunk = MagicMock()
+            chunk.choices = [MagicMock()]
+            chunk.choices[0].delta.content = content
+            chunk.x_groq.usage = usage
+            chunk.usage = None
+            return chunk
+
+        mock_usage = MagicMock()
+        mock_usage.prompt_tokens = 50
+        mock_usage.completion_tokens = 10
+        mock_usage.total_tokens = 60
+        mock_client.chat.completions.create.return_value = iter([
+            make_chunk("Hello! "),
+            make_chunk("How can I help?"),
+            make_chunk(None, usage=mock_usage),
+        ])
 
         engine = ChatEngine(mock_settings)
         response, metrics = engine.send_message("Hi there!")
 
         assert response == "Hello! How can I help?"
+        assert mock_client.chat.completions.create.call_args.kwargs["stream"] is True
         assert metrics.total_tokens == 60
         assert metrics.latency_seconds > 0
-        assert len(engine.history) == 2  # user + assistant
\ No newline at end of file
+        assert metrics.has_code_blocks is False
+        assert len(engine.history) == 2  # user + assistant
+
+    @patch("groq.Groq")
+    def test_send_message_detects_split_code_fence(self, mock_groq_class, mock_settings):
+        """A ``` fence split across stream chunks should set has_code_blocks."""
+        mock_client = MagicMock()
+        mock_groq_class.return_value = mock_client
+
+        chunks = []
+        for content in ["Try this:\n`", "`", "`python\nprint(1)\n```"]:
+            chunk = MagicMock()
+            chunk.choices = [MagicMock()]
+            chunk.choices[0].delta.content = content
+            chunk.x_groq = None
+            chunk.usage = None
+            chunks.append(chunk)
+        mock_client.chat.completions.create.return_value = iter(chunks)
+
+        engine = ChatEngine(mock_settings)
+        response, metrics = engine.send_message("Show me code")
+
+        assert response == "Try this:\n```python\nprint(1)\n```"
+        assert metrics.has_code_blocks is True
\ No newline at end of file
@@ -52,6 +52,15 @@ class TestSettings:
         errors = settings.validate()
         assert any("MAX_TOKENS" in err.upper() for err in errors)
 
+    def test_invalid_max_history(self):
+        """Non-positive max_history should error."""
+        settings = Settings(
+            groq_api_key="gsk_valid_key",
+            max_history=0,
+        )
+        errors = settings.validate()
+        assert any("MAX_HISTORY" in err.upper() for err in errors)
+
 
 class TestLoadSettings:
     """Test loading settings from environment."""
@@ -0,0 +1,48 @@
+"""Tests for loading saved conversations."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from growcli.conversation_manager import ConversationManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Create a manager that saves into tmp_path."""
+    return ConversationManager(save_dir=str(tmp_path / "conversations"))
+
+
+class TestLoadConversation:
+    """Test reading conversation files back in."""
+
+    def test_converts_iso_timestamps(self, manager, tmp_path):
+        """Older saves with ISO-format timestamps load as epoch seconds."""
+        stamp = "2025-01-02T03:04:05.123456"
+        path = tmp_path / "conversation_old.json"
+        path.write_text(json.dumps({
+            "messages": [
+                {"role": "user", "content": "Hi", "timestamp": stamp},
+            ],
+        }), encoding="utf-8")
+
+        assert manager.load_conversation(str(path)) is True
+
+        timestamp = manager.current_conversation[0].timestamp
+        assert isinstance(timestamp, float)
+        assert datetime.fromtimestamp(timestamp) == datetime.fromisoformat(stamp)
+
+    def test_round_trip_keeps_epoch_timestamps(self, manager):
+        """Saved epoch timestamps load back unchanged."""
+        manager.start_session("llama-3.1-8b-instant", 0.7)
+        manager.add_message("user", "Hello", 3, 0)
+        manager.add_message("assistant", "Hi there", 5, 0.25)
+        saved = [msg.timestamp for msg in manager.current_conversation]
+
+        path = manager.save_json()
+        assert manager.load_conversation(path) is True
+
+        loaded = manager.current_conversation
+        assert [msg.timestamp for msg in loaded] == saved
+        assert [msg.content for msg in loaded] == ["Hello", "Hi there"]
@@ -0,0 +1,148 @@
+"""Tests for the cost tracker's history file."""
+
+import json
+import pytest
+
+from growcli.cost_tracker import CostData, CostTracker, MAX_HISTORY_ENTRIES
+
+
+def make_entry(i: int) -> dict:
+    """Build one stored history record."""
+    return {
+        "date": f"2025-01-01 00:00:{i % 60:02d}",
+        "prompt_tokens": i,
+        "completion_tokens": i,
+        "total_tokens": 2 * i,
+        "estimated_cost": 0.0001 * i,
+    }
+
+
+def read_jsonl(path) -> list[dict]:
+    """Read every record from a JSON Lines file."""
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+@pytest.fixture
+def tracker(tmp_path, monkeypatch):
+    """Create a tracker whose conversations/ directory lives in tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    return CostTracker()
+
+
+class TestCostHistory:
+    """Test saving and loading the cost history."""
+
+    def test_fresh_append(self, tracker):
+        """The first save should create the file with a single line."""
+        tracker.add_usage(100, 50)
+        tracker.save_session()
+
+        records = read_jsonl(tracker.cost_file)
+        assert len(records) == 1
+        assert records[0]["prompt_tokens"] == 100
+        assert records[0]["completion_tokens"] == 50
+        assert records[0]["total_tokens"] == 150
+
+    def test_append_keeps_existing_lines(self, tracker):
+        """Later saves should add a line instead of rewriting the file."""
+        tracker.cost_file.parent.mkdir(parents=True)
+        tracker.cost_file.write_text(json.dumps(make_entry(1)) + "\n", encoding="utf-8")
+
+        tracker.add_usage(10, 5)
+        tracker.save_session()
+
+        records = read_jsonl(tracker.cost_file)
+        assert records[0] == make_entry(1)
+        assert records[1]["total_tokens"] == 15
+
+        # A new tracker reads both sessions back
+        assert [item.total_tokens for item in CostTracker().history] == [2, 15]
+
+    @pytest.mark.parametrize("preload", [False, True])
+    def test_migrates_legacy_json(self, tracker, preload):
+        """An old .cost_history.json should be carried over to JSONL."""
+        legacy_file = tracker.cost_file.with_suffix(".json")
+        legacy_file.parent.mkdir(parents=True)
+        legacy_file.write_text(json.dumps([make_entry(1), make_entry(2)]), encoding="utf-8")
+
+        if preload:
+            assert len(tracker.history) == 2
+
+        tracker.add_usage(10, 5)
+        tracker.save_session()
+
+        records = read_jsonl(tracker.cost_file)
+        assert records[:2] == [make_entry(1), make_entry(2)]
+        assert records[2]["total_tokens"] == 15
+        assert len(records) == 3
+        assert len(tracker.history) == 3
+
+    def test_rotates_to_max_entries(self, tracker):
+        """A history file past the size limit is cut to the newest entries."""
+        total = 2 * MAX_HISTORY_ENTRIES + 500
+        tracker.cost_file.parent.mkdir(parents=True)
+        tracker.cost_file.write_text(
+            "".join(json.dumps(make_entry(i)) + "\n" for i in range(total)),
+            encoding="utf-8",
+        )
+
+        tracker.add_usage(7, 3)
+        tracker.save_session()
+
+        records = read_jsonl(tracker.cost_file)
+        assert len(records) == MAX_HISTORY_ENTRIES
+        assert records[0] == make_entry(total - MAX_HISTORY_ENTRIES + 1)
+        assert records[-1]["total_tokens"] == 10
+        assert len(tracker.history) == MAX_HISTORY_ENTRIES
+
+    def test_skips_malformed_line(self, tracker):
+        """One unparseable line should not discard the rest of the history."""
+        tracker.cost_file.parent.mkdir(parents=True)
+        tracker.cost_file.write_text(
+            json.dumps(make_entry(1)) + "\n"
+            + "not json\n"
+            + json.dumps(make_entry(2)) + "\n",
+            encoding="utf-8",
+        )
+
+        assert [item.total_tokens for item in tracker.history] == [2, 4]
+        assert tracker.get_total_cost() == pytest.approx(0.0003)
+
+    def test_append_after_torn_last_line(self, tracker):
+        """A save after an interrupted append should start on a new line."""
+        tracker.cost_file.parent.mkdir(parents=True)
+        tracker.cost_file.write_text(
+            json.dumps(make_entry(1)) + "\n" + '{"date": "2025-01-0',
+            encoding="utf-8",
+        )
+
+        tracker.add_usage(10, 5)
+        tracker.save_session()
+
+        assert [item.total_tokens for item in CostTracker().history] == [2, 15]
+
+    def test_rotation_keeps_sessions_around_torn_line(self, tracker):
+        """Rotating a file with a torn last line should keep the valid sessions."""
+        total = 2 * MAX_HISTORY_ENTRIES + 500
+        tracker.cost_file.parent.mkdir(parents=True)
+        tracker.cost_file.write_text(
+            "".join(json.dumps(make_entry(i)) + "\n" for i in range(total))
+            + '{"date": "2025-01-0',
+            encoding="utf-8",
+        )
+
+        tracker.add_usage(10, 5)
+        tracker.save_session()
+
+        history = CostTracker().history
+        assert len(history) == MAX_HISTORY_ENTRIES - 1
+        assert history[0] == CostData(**make_entry(total - MAX_HISTORY_ENTRIES + 2))
+        assert history[-1].total_tokens == 15
+
+    def test_total_cost_from_history(self, tracker):
+        """Total cost should sum every stored session."""
+        tracker._history = [
+            CostData(**make_entry(1)),
+            CostData(**make_entry(2)),
+        ]
+        assert tracker.get_total_cost() == pytest.approx(0.0003)